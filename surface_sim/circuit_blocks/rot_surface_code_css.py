@@ -91,10 +91,9 @@ def qec_round(
 
     https://doi.org/10.1103/PhysRevApplied.8.034021
     """
-    circuit = sum(
-        qec_round_iterator(model=model, layout=layout, anc_reset=anc_reset),
-        start=Circuit(),
-    )
+    circuit = Circuit()
+    for block in qec_round_iterator(model=model, layout=layout, anc_reset=anc_reset):
+        circuit += block
 
     # add detectors
     anc_qubits = layout.get_qubits(role="anc")
@@ -90,10 +90,9 @@ def log_meas(
     if set(anc_detectors) > set(anc_qubits):
         raise ValueError("Some of the given 'anc_qubits' are not ancilla qubits.")
 
-    circuit = sum(
-        log_meas_iterator(model=model, layout=layout, rot_basis=rot_basis),
-        start=Circuit(),
-    )
+    circuit = Circuit()
+    for block in log_meas_iterator(model=model, layout=layout, rot_basis=rot_basis):
+        circuit += block
 
     # detectors and logical observables
     stab_type = "x_type" if rot_basis else "z_type"
@@ -206,15 +205,12 @@ def init_qubits(
     # so no QEC cycles are run simultaneously
     anc_qubits = layout.get_qubits(role="anc")
     detectors.activate_detectors(anc_qubits)
-    return sum(
-        init_qubits_iterator(
-            model=model,
-            layout=layout,
-            data_init=data_init,
-            rot_basis=rot_basis,
-        ),
-        start=Circuit(),
-    )
+    circuit = Circuit()
+    for block in init_qubits_iterator(
+        model=model, layout=layout, data_init=data_init, rot_basis=rot_basis
+    ):
+        circuit += block
+    return circuit
 
 
 def init_qubits_iterator(
@@ -334,7 +330,10 @@ def log_x(model: Model, layout: Layout, detectors: Detectors) -> Circuit:
     of the given model.
     """
     # the stabilizer generators do not change when applying a logical X gate
-    return sum(log_x_iterator(model=model, layout=layout), start=Circuit())
+    circuit = Circuit()
+    for block in log_x_iterator(model=model, layout=layout):
+        circuit += block
+    return circuit
 
 
 @sq_gate
@@ -364,7 +363,10 @@ def log_z(model: Model, layout: Layout, detectors: Detectors) -> Circuit:
     of the given model.
     """
     # the stabilizer generators do not change when applying a logical Z gate
-    return sum(log_z_iterator(model=model, layout=layout), start=Circuit())
+    circuit = Circuit()
+    for block in log_z_iterator(model=model, layout=layout):
+        circuit += block
+    return circuit
 
 
 @sq_gate
@@ -402,7 +404,10 @@ def log_fold_trans_s(model: Model, layout: Layout, detectors: Detectors) -> Circ
     gate_label = f"log_fold_trans_s_{layout.get_logical_qubits()[0]}"
     new_stabs = get_new_stab_dict_from_layout(layout, gate_label)
     detectors.update_from_dict(new_stabs)
-    return sum(log_fold_trans_s_iterator(model=model, layout=layout), start=Circuit())
+    circuit = Circuit()
+    for block in log_fold_trans_s_iterator(model=model, layout=layout):
+        circuit += block
+    return circuit
 
 
 @sq_gate
@@ -474,7 +479,10 @@ def log_fold_trans_h(model: Model, layout: Layout, detectors: Detectors) -> Circ
     gate_label = f"log_fold_trans_h_{layout.get_logical_qubits()[0]}"
     new_stabs = get_new_stab_dict_from_layout(layout, gate_label)
     detectors.update_from_dict(new_stabs)
-    return sum(log_fold_trans_h_iterator(model=model, layout=layout), start=Circuit())
+    circuit = Circuit()
+    for block in log_fold_trans_h_iterator(model=model, layout=layout):
+        circuit += block
+    return circuit
 
 
 @sq_gate
@@ -546,10 +554,12 @@ def log_trans_cnot(
     new_stabs = get_new_stab_dict_from_layout(layout_c, gate_label)
     new_stabs.update(get_new_stab_dict_from_layout(layout_t, gate_label))
     detectors.update_from_dict(new_stabs)
-    return sum(
-        log_trans_cnot_iterator(model=model, layout_c=layout_c, layout_t=layout_t),
-        start=Circuit(),
-    )
+    circuit = Circuit()
+    for block in log_trans_cnot_iterator(
+        model=model, layout_c=layout_c, layout_t=layout_t
+    ):
+        circuit += block
+    return circuit
 
 
 @tq_gate
@@ -648,10 +658,11 @@ def log_meas_xzzx(
     if set(anc_detectors) > set(layout.get_qubits(role="anc")):
         raise ValueError("Some of the given 'anc_qubits' are not ancilla qubits.")
 
-    circuit = sum(
-        log_meas_xzzx_iterator(model=model, layout=layout, rot_basis=rot_basis),
-        start=Circuit(),
-    )
+    circuit = Circuit()
+    for block in log_meas_xzzx_iterator(
+        model=model, layout=layout, rot_basis=rot_basis
+    ):
+        circuit += block
 
     # detectors and logical observables
     stab_type = "x_type" if rot_basis else "z_type"
@@ -745,7 +756,10 @@ def log_x_xzzx(model: Model, layout: Layout, detectors: Detectors) -> Circuit:
     of the given model.
     """
     # the stabilizer generators do not change when applying a logical X gate
-    return sum(log_x_xzzx_iterator(model=model, layout=layout), start=Circuit())
+    circuit = Circuit()
+    for block in log_x_xzzx_iterator(model=model, layout=layout):
+        circuit += block
+    return circuit
 
 
 @sq_gate
@@ -781,7 +795,10 @@ def log_z_xzzx(model: Model, layout: Layout, detectors: Detectors) -> Circuit:
     of the given model.
     """
     # the stabilizer generators do not change when applying a logical Z gate
-    return sum(log_z_xzzx_iterator(model=model, layout=layout), start=Circuit())
+    circuit = Circuit()
+    for block in log_z_xzzx_iterator(model=model, layout=layout):
+        circuit += block
+    return circuit
 
 
 @sq_gate
@@ -830,12 +847,12 @@ def init_qubits_xzzx(
     # so no QEC cycles are run simultaneously
     anc_qubits = layout.get_qubits(role="anc")
     detectors.activate_detectors(anc_qubits)
-    return sum(
-        init_qubits_xzzx_iterator(
-            model=model, layout=layout, data_init=data_init, rot_basis=rot_basis
-        ),
-        start=Circuit(),
-    )
+    circuit = Circuit()
+    for block in init_qubits_xzzx_iterator(
+        model=model, layout=layout, data_init=data_init, rot_basis=rot_basis
+    ):
+        circuit += block
+    return circuit
 
 
 def init_qubits_xzzx_iterator(
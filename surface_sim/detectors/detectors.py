@@ -342,7 +342,7 @@ class Detectors:
             else:
                 # create the detector but make it be always 0
                 detectors_rec = []
-            coords = [*self.anc_coords[anc], self.total_num_rounds - 1]
+            coords = (*self.anc_coords[anc], self.total_num_rounds - 1)
             instr = stim.CircuitInstruction(
                 "DETECTOR", gate_args=coords, targets=detectors_rec
             )
@@ -492,7 +492,7 @@ class Detectors:
             else:
                 # create the detector but make it be always 0
                 detectors_rec = []
-            coords = [*self.anc_coords[anc], self.total_num_rounds - 0.5]
+            coords = (*self.anc_coords[anc], self.total_num_rounds - 0.5)
             instr = stim.CircuitInstruction(
                 "DETECTOR", gate_args=coords, targets=detectors_rec
             )
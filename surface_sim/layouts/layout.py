@@ -163,7 +163,7 @@ class Layout:
 
     def qubit_inds(self) -> dict[str, int]:
         """Returns a dictionary mapping all the qubits to their indices."""
-        return {k: v for k, v in self._qubit_inds.items()}
+        return self._qubit_inds.copy()
 
     def get_max_ind(self) -> int:
         """Returns the largest qubit index in the layout."""
@@ -1,10 +1,11 @@
 from collections.abc import Iterable, Sequence
+from functools import partial
 
-from stim import CircuitInstruction, Circuit
+from stim import Circuit
 
 from ..setup import Setup
 from .model import Model
-from .util import biased_prefactors, grouper, idle_error_probs
+from .util import biased_prefactors, idle_error_probs
 
 
 class CircuitNoiseModel(Model):
@@ -13,196 +14,114 @@ class CircuitNoiseModel(Model):
 
     def x_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("X", inds))
+        inds_by_prob = self._inds_by_param("x_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("x_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
-        return circ
+        return self._gate_circuit("X", inds, "DEPOLARIZE1", inds_by_prob)
 
     def z_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("Z", inds))
+        inds_by_prob = self._inds_by_param("z_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("z_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
-        return circ
+        return self._gate_circuit("Z", inds, "DEPOLARIZE1", inds_by_prob)
 
     def hadamard(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("H", inds))
+        inds_by_prob = self._inds_by_param("h_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("h_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
-        return circ
+        return self._gate_circuit("H", inds, "DEPOLARIZE1", inds_by_prob)
 
     def s_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("S", inds))
+        inds_by_prob = self._inds_by_param("s_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("s_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
-        return circ
+        return self._gate_circuit("S", inds, "DEPOLARIZE1", inds_by_prob)
 
     def s_dag_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("S_DAG", inds))
+        inds_by_prob = self._inds_by_param("sdag_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("sdag_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
-        return circ
+        return self._gate_circuit("S_DAG", inds, "DEPOLARIZE1", inds_by_prob)
 
     def cphase(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("CZ", inds))
+        inds_by_prob = self._inds_by_param("cz_error_prob", qubits, inds, pairs=True)
 
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("cz_error_prob", *qubit_pair)
-            circ.append(CircuitInstruction("DEPOLARIZE2", ind_pair, [prob]))
-        return circ
+        return self._gate_circuit("CZ", inds, "DEPOLARIZE2", inds_by_prob)
 
     def cnot(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("CNOT", inds))
+        inds_by_prob = self._inds_by_param("cnot_error_prob", qubits, inds, pairs=True)
 
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("cnot_error_prob", *qubit_pair)
-            circ.append(CircuitInstruction("DEPOLARIZE2", ind_pair, [prob]))
-        return circ
+        return self._gate_circuit("CNOT", inds, "DEPOLARIZE2", inds_by_prob)
 
     def swap(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("SWAP", inds))
+        inds_by_prob = self._inds_by_param("swap_error_prob", qubits, inds, pairs=True)
 
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("swap_error_prob", *qubit_pair)
-            circ.append(CircuitInstruction("DEPOLARIZE2", ind_pair, [prob]))
-        return circ
+        return self._gate_circuit("SWAP", inds, "DEPOLARIZE2", inds_by_prob)
 
     def measure(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MZ", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MZ", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MZ", meas_runs, "X_ERROR", inds_by_prob)
 
     def measure_x(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MX", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MX", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MX", meas_runs, "Z_ERROR", inds_by_prob)
 
     def measure_y(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MY", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MY", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MY", meas_runs, "Z_ERROR", inds_by_prob)
 
     def reset(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("R", inds))
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("R", inds, "X_ERROR", inds_by_prob)
 
     def reset_x(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        circ.append(CircuitInstruction("RX", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("RX", inds, "Z_ERROR", inds_by_prob)
 
     def reset_y(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        circ.append(CircuitInstruction("RY", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("RY", inds, "Z_ERROR", inds_by_prob)
 
     def idle(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
         circ = Circuit()
 
-        circ.append(CircuitInstruction("I", inds))
+        circ.append(self._instr("I", inds))
         circ += self.idle_noise(qubits)
 
         return circ
@@ -211,9 +130,11 @@ class CircuitNoiseModel(Model):
         inds = self.get_inds(qubits)
         circ = Circuit()
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("idle_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
+        inds_by_prob = self._inds_by_param("idle_error_prob", qubits, inds)
+        for prob, prob_inds in inds_by_prob.items():
+            # zero-probability noise channels are not added to the circuit
+            if prob:
+                circ.append(self._instr("DEPOLARIZE1", prob_inds, (prob,)))
         return circ
 
     def incoming_noise(self, qubits: Iterable[str]) -> Circuit:
@@ -224,246 +145,134 @@ class BiasedCircuitNoiseModel(Model):
     def __init__(self, setup: Setup, qubit_inds: dict[str, int]) -> None:
         super().__init__(setup, qubit_inds)
 
+    def _biased_probs(self, param: str, *qubits: str) -> tuple[float, ...]:
+        """Returns the biased Pauli channel probabilities of ``param``
+        for the given qubit or pair of qubits."""
+        prefactors = biased_prefactors(
+            biased_pauli=self.param("biased_pauli", *qubits),
+            biased_factor=self.param("biased_factor", *qubits),
+            num_qubits=len(qubits),
+        )
+        return tuple(self.param(param, *qubits) * prefactors)
+
     def x_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        biased_probs = partial(self._biased_probs, "x_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs)
 
-        circ.append(CircuitInstruction("X", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("x_error_prob", qubit)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", qubit),
-                biased_factor=self.param("biased_factor", qubit),
-                num_qubits=1,
-            )
-            probs = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_1", [ind], probs))
-        return circ
+        return self._gate_circuit("X", inds, "PAULI_CHANNEL_1", inds_by_probs)
 
     def z_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        biased_probs = partial(self._biased_probs, "z_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs)
 
-        circ.append(CircuitInstruction("Z", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("z_error_prob", qubit)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", qubit),
-                biased_factor=self.param("biased_factor", qubit),
-                num_qubits=1,
-            )
-            probs = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_1", [ind], probs))
-        return circ
+        return self._gate_circuit("Z", inds, "PAULI_CHANNEL_1", inds_by_probs)
 
     def hadamard(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        biased_probs = partial(self._biased_probs, "h_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs)
 
-        circ.append(CircuitInstruction("H", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("h_error_prob", qubit)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", qubit),
-                biased_factor=self.param("biased_factor", qubit),
-                num_qubits=1,
-            )
-            probs = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_1", [ind], probs))
-        return circ
+        return self._gate_circuit("H", inds, "PAULI_CHANNEL_1", inds_by_probs)
 
     def s_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        biased_probs = partial(self._biased_probs, "s_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs)
 
-        circ.append(CircuitInstruction("S", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("s_error_prob", qubit)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", qubit),
-                biased_factor=self.param("biased_factor", qubit),
-                num_qubits=1,
-            )
-            probs = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_1", [ind], probs))
-        return circ
+        return self._gate_circuit("S", inds, "PAULI_CHANNEL_1", inds_by_probs)
 
     def s_dag_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        biased_probs = partial(self._biased_probs, "sdag_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs)
 
-        circ.append(CircuitInstruction("S_DAG", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("sdag_error_prob", qubit)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", qubit),
-                biased_factor=self.param("biased_factor", qubit),
-                num_qubits=1,
-            )
-            probs = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_1", [ind], probs))
-        return circ
+        return self._gate_circuit("S_DAG", inds, "PAULI_CHANNEL_1", inds_by_probs)
 
     def cphase(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        biased_probs = partial(self._biased_probs, "cz_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs, pairs=True)
 
-        circ.append(CircuitInstruction("CZ", inds))
-
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("cz_error_prob", *qubit_pair)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", *qubit_pair),
-                biased_factor=self.param("biased_factor", *qubit_pair),
-                num_qubits=2,
-            )
-            probs = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_2", ind_pair, probs))
-        return circ
+        return self._gate_circuit("CZ", inds, "PAULI_CHANNEL_2", inds_by_probs)
 
     def cnot(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        biased_probs = partial(self._biased_probs, "cnot_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs, pairs=True)
 
-        circ.append(CircuitInstruction("CNOT", inds))
-
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("cnot_error_prob", *qubit_pair)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", *qubit_pair),
-                biased_factor=self.param("biased_factor", *qubit_pair),
-                num_qubits=2,
-            )
-            probs = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_2", ind_pair, probs))
-        return circ
+        return self._gate_circuit("CNOT", inds, "PAULI_CHANNEL_2", inds_by_probs)
 
     def swap(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        biased_probs = partial(self._biased_probs, "swap_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs, pairs=True)
 
-        circ.append(CircuitInstruction("SWAP", inds))
-
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("swap_error_prob", *qubit_pair)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", *qubit_pair),
-                biased_factor=self.param("biased_factor", *qubit_pair),
-                num_qubits=2,
-            )
-            probs = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_2", ind_pair, probs))
-        return circ
+        return self._gate_circuit("SWAP", inds, "PAULI_CHANNEL_2", inds_by_probs)
 
     def measure(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MZ", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MZ", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MZ", meas_runs, "X_ERROR", inds_by_prob)
 
     def measure_x(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MX", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MX", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MX", meas_runs, "Z_ERROR", inds_by_prob)
 
     def measure_y(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MX", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MX", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MX", meas_runs, "X_ERROR", inds_by_prob)
 
     def reset(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        circ.append(CircuitInstruction("R", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("R", inds, "X_ERROR", inds_by_prob)
 
     def reset_x(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        circ.append(CircuitInstruction("RX", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("RX", inds, "Z_ERROR", inds_by_prob)
 
     def reset_y(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        circ.append(CircuitInstruction("RY", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("RY", inds, "Z_ERROR", inds_by_prob)
 
     def idle(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
         circ = Circuit()
 
-        circ.append(CircuitInstruction("I", inds))
+        circ.append(self._instr("I", inds))
         circ += self.idle_noise(qubits)
 
         return circ
@@ -472,15 +281,12 @@ class BiasedCircuitNoiseModel(Model):
         inds = self.get_inds(qubits)
         circ = Circuit()
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("idle_error_prob", qubit)
-            prefactors = biased_prefactors(
-                biased_pauli=self.param("biased_pauli", qubit),
-                biased_factor=self.param("biased_factor", qubit),
-                num_qubits=1,
-            )
-            prob = prob * prefactors
-            circ.append(CircuitInstruction("PAULI_CHANNEL_1", [ind], prob))
+        biased_probs = partial(self._biased_probs, "idle_error_prob")
+        inds_by_probs = self._group_inds(qubits, inds, biased_probs)
+        for probs, probs_inds in inds_by_probs.items():
+            # zero-probability noise channels are not added to the circuit
+            if any(probs):
+                circ.append(self._instr("PAULI_CHANNEL_1", probs_inds, probs))
         return circ
 
     def incoming_noise(self, qubits: Iterable[str]) -> Circuit:
@@ -518,12 +324,12 @@ class DecoherenceNoiseModel(Model):
             duration = 0.5 * self.gate_duration(name)
 
             circ += self.idle_noise(qubits, duration)
-            circ.append(CircuitInstruction(name, targets=self.get_inds(qubits)))
+            circ.append(self._instr(name, self.get_inds(qubits)))
             circ += self.idle_noise(qubits, duration)
         else:
             duration = self.gate_duration(name)
 
-            circ.append(CircuitInstruction(name, targets=self.get_inds(qubits)))
+            circ.append(self._instr(name, self.get_inds(qubits)))
             circ += self.idle_noise(qubits, duration)
         return circ
 
@@ -554,97 +360,52 @@ class DecoherenceNoiseModel(Model):
     def measure(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
         name = "M"
+        duration = self.gate_duration(name)
         if self._sym_noise:
-            duration = 0.5 * self.gate_duration(name)
-
-            circ += self.idle_noise(qubits, duration)
-            for qubit in qubits:
-                self.add_meas(qubit)
-
-                if self.param("assign_error_flag", qubit):
-                    prob = self.param("assign_error_prob", qubit)
-                    circ.append(
-                        CircuitInstruction(
-                            name, targets=self.get_inds([qubit]), gate_args=[prob]
-                        )
-                    )
-                else:
-                    circ.append(
-                        CircuitInstruction(name, targets=self.get_inds([qubit]))
-                    )
+            duration *= 0.5
             circ += self.idle_noise(qubits, duration)
-        else:
-            duration = self.gate_duration(name)
 
-            for qubit in qubits:
-                self.add_meas(qubit)
+        self.add_meas_many(qubits)
+
+        meas_runs = self._meas_runs(qubits, self.get_inds(qubits))
+        circ += self._meas_circuit(name, meas_runs)
 
-                circ.append(CircuitInstruction(name, targets=[qubit]))
-                circ += self.idle_noise(qubit, duration)
+        # the idle noise of all qubits is added at once after the measurements
+        circ += self.idle_noise(qubits, duration)
         return circ
 
     def measure_x(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
         name = "MX"
+        duration = self.gate_duration(name)
         if self._sym_noise:
-            duration = 0.5 * self.gate_duration(name)
-
-            circ += self.idle_noise(qubits, duration)
-            for qubit in qubits:
-                self.add_meas(qubit)
-
-                if self.param("assign_error_flag", qubit):
-                    prob = self.param("assign_error_prob", qubit)
-                    circ.append(
-                        CircuitInstruction(
-                            name, targets=self.get_inds([qubit]), gate_args=[prob]
-                        )
-                    )
-                else:
-                    circ.append(
-                        CircuitInstruction(name, targets=self.get_inds([qubit]))
-                    )
+            duration *= 0.5
             circ += self.idle_noise(qubits, duration)
-        else:
-            duration = self.gate_duration(name)
 
-            for qubit in qubits:
-                self.add_meas(qubit)
+        self.add_meas_many(qubits)
+
+        meas_runs = self._meas_runs(qubits, self.get_inds(qubits))
+        circ += self._meas_circuit(name, meas_runs)
 
-                circ.append(CircuitInstruction(name, targets=[qubit]))
-                circ += self.idle_noise(qubit, duration)
+        # the idle noise of all qubits is added at once after the measurements
+        circ += self.idle_noise(qubits, duration)
         return circ
 
     def measure_y(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
         name = "MY"
+        duration = self.gate_duration(name)
         if self._sym_noise:
-            duration = 0.5 * self.gate_duration(name)
-
-            circ += self.idle_noise(qubits, duration)
-            for qubit in qubits:
-                self.add_meas(qubit)
-
-                if self.param("assign_error_flag", qubit):
-                    prob = self.param("assign_error_prob", qubit)
-                    circ.append(
-                        CircuitInstruction(
-                            name, targets=self.get_inds([qubit]), gate_args=[prob]
-                        )
-                    )
-                else:
-                    circ.append(
-                        CircuitInstruction(name, targets=self.get_inds([qubit]))
-                    )
+            duration *= 0.5
             circ += self.idle_noise(qubits, duration)
-        else:
-            duration = self.gate_duration(name)
 
-            for qubit in qubits:
-                self.add_meas(qubit)
+        self.add_meas_many(qubits)
+
+        meas_runs = self._meas_runs(qubits, self.get_inds(qubits))
+        circ += self._meas_circuit(name, meas_runs)
 
-                circ.append(CircuitInstruction(name, targets=[qubit]))
-                circ += self.idle_noise(qubit, duration)
+        # the idle noise of all qubits is added at once after the measurements
+        circ += self.idle_noise(qubits, duration)
         return circ
 
     def reset(self, qubits: Iterable[str]) -> Circuit:
@@ -660,7 +421,7 @@ class DecoherenceNoiseModel(Model):
         inds = self.get_inds(qubits)
         circ = Circuit()
 
-        circ.append(CircuitInstruction("I", inds))
+        circ.append(self._instr("I", inds))
         circ += self.idle_noise(qubits, duration=duration)
 
         return circ
@@ -681,23 +442,19 @@ class DecoherenceNoiseModel(Model):
         Circuit
             The circuit instructions for an idling period on the given qubits.
         """
+        inds = self.get_inds(qubits)
         circ = Circuit()
 
-        for qubit in qubits:
-            relax_time = self.param("T1", qubit)
-            deph_time = self.param("T2", qubit)
+        # qubits with the same T1 and T2 share the same error probabilities
+        inds_by_times = self._group_inds(
+            qubits, inds, lambda q: (self.param("T1", q), self.param("T2", q))
+        )
+        for (relax_time, deph_time), times_inds in inds_by_times.items():
             # check that the parameters are physical
             assert (relax_time > 0) and (deph_time > 0) and (deph_time < 2 * relax_time)
 
             error_probs = idle_error_probs(relax_time, deph_time, duration)
-
-            circ.append(
-                CircuitInstruction(
-                    "PAULI_CHANNEL_1",
-                    targets=self.get_inds([qubit]),
-                    gate_args=error_probs,
-                )
-            )
+            circ.append(self._instr("PAULI_CHANNEL_1", times_inds, error_probs))
         return circ
 
     def incoming_noise(self, qubits: Iterable[str]) -> Circuit:
@@ -712,176 +469,102 @@ class ExperimentalNoiseModel(Model):
 
     def x_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("x_error_prob", qubits, inds)
 
-        circ.append(CircuitInstruction("X", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("x_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
-
-        return circ
+        return self._gate_circuit("X", inds, "DEPOLARIZE1", inds_by_prob)
 
     def z_gate(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("Z", inds))
+        inds_by_prob = self._inds_by_param("z_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("z_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
-
-        return circ
+        return self._gate_circuit("Z", inds, "DEPOLARIZE1", inds_by_prob)
 
     def hadamard(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("h_error_prob", qubits, inds)
 
-        circ.append(CircuitInstruction("H", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("h_error_prob", qubit)
-            circ.append(CircuitInstruction("DEPOLARIZE1", [ind], [prob]))
-        return circ
+        return self._gate_circuit("H", inds, "DEPOLARIZE1", inds_by_prob)
 
     def cphase(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("cz_error_prob", qubits, inds, pairs=True)
 
-        circ.append(CircuitInstruction("CZ", inds))
-
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("cz_error_prob", *qubit_pair)
-            circ.append(CircuitInstruction("DEPOLARIZE2", ind_pair, [prob]))
-        return circ
+        return self._gate_circuit("CZ", inds, "DEPOLARIZE2", inds_by_prob)
 
     def cnot(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("cnot_error_prob", qubits, inds, pairs=True)
 
-        circ.append(CircuitInstruction("CNOT", inds))
-
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("cnot_error_prob", *qubit_pair)
-            circ.append(CircuitInstruction("DEPOLARIZE2", ind_pair, [prob]))
-        return circ
+        return self._gate_circuit("CNOT", inds, "DEPOLARIZE2", inds_by_prob)
 
     def swap(self, qubits: Sequence[str]) -> Circuit:
         if len(qubits) % 2 != 0:
             raise ValueError("Expected and even number of qubits.")
 
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("swap_error_prob", qubits, inds, pairs=True)
 
-        circ.append(CircuitInstruction("SWAP", inds))
-
-        for qubit_pair, ind_pair in zip(grouper(qubits, 2), grouper(inds, 2)):
-            prob = self.param("swap_error_prob", *qubit_pair)
-            circ.append(CircuitInstruction("DEPOLARIZE2", ind_pair, [prob]))
-        return circ
+        return self._gate_circuit("SWAP", inds, "DEPOLARIZE2", inds_by_prob)
 
     def measure(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MZ", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MZ", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MZ", meas_runs, "X_ERROR", inds_by_prob)
 
     def measure_x(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MX", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MX", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MX", meas_runs, "Z_ERROR", inds_by_prob)
 
     def measure_y(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MY", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MY", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MY", meas_runs, "X_ERROR", inds_by_prob)
 
     def reset(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        circ.append(CircuitInstruction("R", inds))
-
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("R", inds, "X_ERROR", inds_by_prob)
 
     def reset_x(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("RX", inds))
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("RX", inds, "Z_ERROR", inds_by_prob)
 
     def reset_y(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        circ.append(CircuitInstruction("RY", inds))
+        inds_by_prob = self._inds_by_param("reset_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("reset_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-        return circ
+        return self._gate_circuit("RY", inds, "X_ERROR", inds_by_prob)
 
     def idle(self, qubits: Iterable[str], duration: float) -> Circuit:
         inds = self.get_inds(qubits)
         circ = Circuit()
 
-        circ.append(CircuitInstruction("I", inds))
+        circ.append(self._instr("I", inds))
         circ += self.idle_noise(qubits, duration=duration)
 
         return circ
@@ -902,22 +585,19 @@ class ExperimentalNoiseModel(Model):
         Circuit
             The circuit instructions for an idling period on the given qubits.
         """
+        inds = self.get_inds(qubits)
         circ = Circuit()
-        for qubit in qubits:
-            relax_time = self.param("T1", qubit)
-            deph_time = self.param("T2", qubit)
+
+        # qubits with the same T1 and T2 share the same error probabilities
+        inds_by_times = self._group_inds(
+            qubits, inds, lambda q: (self.param("T1", q), self.param("T2", q))
+        )
+        for (relax_time, deph_time), times_inds in inds_by_times.items():
             # check that the parameters are physical
             assert (relax_time > 0) and (deph_time > 0) and (deph_time < 2 * relax_time)
 
             error_probs = idle_error_probs(relax_time, deph_time, duration)
-
-            circ.append(
-                CircuitInstruction(
-                    "PAULI_CHANNEL_1",
-                    targets=self.get_inds([qubit]),
-                    gate_args=error_probs,
-                )
-            )
+            circ.append(self._instr("PAULI_CHANNEL_1", times_inds, error_probs))
         return circ
 
     def incoming_noise(self, qubits: Iterable[str]) -> Circuit:
@@ -933,85 +613,82 @@ class NoiselessModel(Model):
 
     def x_gate(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("X", self.get_inds(qubits)))
+        circ.append(self._instr("X", self.get_inds(qubits)))
         return circ
 
     def z_gate(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("Z", self.get_inds(qubits)))
+        circ.append(self._instr("Z", self.get_inds(qubits)))
         return circ
 
     def hadamard(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("H", self.get_inds(qubits)))
+        circ.append(self._instr("H", self.get_inds(qubits)))
         return circ
 
     def s_gate(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("S", self.get_inds(qubits)))
+        circ.append(self._instr("S", self.get_inds(qubits)))
         return circ
 
     def s_dag_gate(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("S_DAG", self.get_inds(qubits)))
+        circ.append(self._instr("S_DAG", self.get_inds(qubits)))
         return circ
 
     def cphase(self, qubits: Sequence[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("CZ", self.get_inds(qubits)))
+        circ.append(self._instr("CZ", self.get_inds(qubits)))
         return circ
 
     def cnot(self, qubits: Sequence[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("CNOT", self.get_inds(qubits)))
+        circ.append(self._instr("CNOT", self.get_inds(qubits)))
         return circ
 
     def swap(self, qubits: Sequence[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("SWAP", self.get_inds(qubits)))
+        circ.append(self._instr("SWAP", self.get_inds(qubits)))
         return circ
 
     def measure(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        for qubit in qubits:
-            self.add_meas(qubit)
-            circ.append(CircuitInstruction("M", self.get_inds([qubit])))
+        self.add_meas_many(qubits)
+        circ.append(self._instr("M", self.get_inds(qubits)))
         return circ
 
     def measure_x(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        for qubit in qubits:
-            self.add_meas(qubit)
-            circ.append(CircuitInstruction("MX", self.get_inds([qubit])))
+        self.add_meas_many(qubits)
+        circ.append(self._instr("MX", self.get_inds(qubits)))
         return circ
 
     def measure_y(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        for qubit in qubits:
-            self.add_meas(qubit)
-            circ.append(CircuitInstruction("MY", self.get_inds([qubit])))
+        self.add_meas_many(qubits)
+        circ.append(self._instr("MY", self.get_inds(qubits)))
         return circ
 
     def reset(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("R", self.get_inds(qubits)))
+        circ.append(self._instr("R", self.get_inds(qubits)))
         return circ
 
     def reset_x(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("RX", self.get_inds(qubits)))
+        circ.append(self._instr("RX", self.get_inds(qubits)))
         return circ
 
     def reset_y(self, qubits: Iterable[str]) -> Circuit:
         circ = Circuit()
-        circ.append(CircuitInstruction("RY", self.get_inds(qubits)))
+        circ.append(self._instr("RY", self.get_inds(qubits)))
         return circ
 
     def idle(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
         circ = Circuit()
 
-        circ.append(CircuitInstruction("I", inds))
+        circ.append(self._instr("I", inds))
         circ += self.idle_noise(qubits)
 
         return circ
@@ -1025,148 +702,62 @@ class NoiselessModel(Model):
 
 class IncomingNoiseModel(NoiselessModel):
     def __init__(self, setup: Setup, qubit_inds: dict[str, int]) -> None:
-        self._setup = setup
-        self._qubit_inds = qubit_inds
-        self._meas_order = {q: [] for q in qubit_inds}
-        self._num_meas = 0
-        return
+        # 'NoiselessModel.__init__' uses an empty setup
+        return Model.__init__(self, setup=setup, qubit_inds=qubit_inds)
 
     def incoming_noise(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
         circ = Circuit()
 
-        # Split the 'for' loop in two so that the stim diagram looks better
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("idle_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
+        inds_by_prob = self._inds_by_param("idle_error_prob", qubits, inds)
 
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("idle_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-
-        return circ
+        # zero-probability noise channels are not added to the circuit
+        inds_by_prob = {p: p_inds for p, p_inds in inds_by_prob.items() if p}
 
-
-class PhenomenologicalNoiseModel(IncomingNoiseModel):
-    def measure(self, qubits: Iterable[str]) -> Circuit:
-        inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MZ", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MZ", [ind]))
-
-        return circ
-
-    def measure_x(self, qubits: Iterable[str]) -> Circuit:
-        inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MX", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MX", [ind]))
-
-        return circ
-
-    def measure_y(self, qubits: Iterable[str]) -> Circuit:
-        inds = self.get_inds(qubits)
-        circ = Circuit()
-
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MY", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MY", [ind]))
+        # all X_ERRORs go before the Z_ERRORs so that the stim diagram looks better
+        for prob, prob_inds in inds_by_prob.items():
+            circ.append(self._instr("X_ERROR", prob_inds, (prob,)))
+        for prob, prob_inds in inds_by_prob.items():
+            circ.append(self._instr("Z_ERROR", prob_inds, (prob,)))
 
         return circ
 
 
 class MeasurementNoiseModel(NoiselessModel):
     def __init__(self, setup: Setup, qubit_inds: dict[str, int]) -> None:
-        self._setup = setup
-        self._qubit_inds = qubit_inds
-        self._meas_order = {q: [] for q in qubit_inds}
-        self._num_meas = 0
-        return
+        # 'NoiselessModel.__init__' uses an empty setup
+        return Model.__init__(self, setup=setup, qubit_inds=qubit_inds)
 
     def measure(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MZ", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MZ", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MZ", meas_runs, "X_ERROR", inds_by_prob)
 
     def measure_x(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
 
-        # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("Z_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MX", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MX", [ind]))
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
-        return circ
+        # separates X_ERROR and MZ for clearer stim diagrams
+        return self._meas_circuit("MX", meas_runs, "Z_ERROR", inds_by_prob)
 
     def measure_y(self, qubits: Iterable[str]) -> Circuit:
         inds = self.get_inds(qubits)
-        circ = Circuit()
+        self.add_meas_many(qubits)
+
+        inds_by_prob = self._inds_by_param("meas_error_prob", qubits, inds)
+        meas_runs = self._meas_runs(qubits, inds)
 
         # separates X_ERROR and MZ for clearer stim diagrams
-        for qubit, ind in zip(qubits, inds):
-            prob = self.param("meas_error_prob", qubit)
-            circ.append(CircuitInstruction("X_ERROR", [ind], [prob]))
-
-        for qubit, ind in zip(qubits, inds):
-            self.add_meas(qubit)
-            if self.param("assign_error_flag", qubit):
-                prob = self.param("assign_error_prob", qubit)
-                circ.append(CircuitInstruction("MY", [ind], [prob]))
-            else:
-                circ.append(CircuitInstruction("MY", [ind]))
+        return self._meas_circuit("MY", meas_runs, "X_ERROR", inds_by_prob)
 
-        return circ
+
+class PhenomenologicalNoiseModel(IncomingNoiseModel, MeasurementNoiseModel):
+    """Noise model with incoming noise and measurement noise."""
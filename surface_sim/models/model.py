@@ -1,6 +1,13 @@
-from collections.abc import Sequence, Iterable
+from collections.abc import Sequence, Iterable, Callable, Hashable
+from functools import partial
 
-from stim import CircuitInstruction, target_rec, GateTarget, Circuit
+from stim import (
+    CircuitInstruction,
+    CircuitRepeatBlock,
+    target_rec,
+    GateTarget,
+    Circuit,
+)
 
 from ..setup import Setup
 
@@ -11,6 +18,9 @@ class Model(object):
         self._qubit_inds = qubit_inds
         self._meas_order = {q: [] for q in qubit_inds}
         self._num_meas = 0
+        self._inds_cache = {}
+        self._instr_cache = {}
+        self._circ_cache = {}
         return
 
     @property
@@ -28,11 +38,173 @@ class Model(object):
         # The proper annotation for this function should be "-> list[int]"
         # but stim gets confused and only accepts list[object] making the
         # LSP unusable with all the errors.
-        return [self._qubit_inds[q] for q in qubits]
+        # The same qubits are used in every QEC round, thus the indices are
+        # cached as a tuple and a new list is returned so that the cached
+        # indices cannot be modified by the caller.
+        qubits = tuple(qubits)
+        inds = self._inds_cache.get(qubits)
+        if inds is None:
+            # 'map' with the bound '__getitem__' runs the loop in C.
+            inds = tuple(map(self._qubit_inds.__getitem__, qubits))
+            self._inds_cache[qubits] = inds
+        return list(inds)
 
     def param(self, *qubits: str):
         return self._setup.param(*qubits)
 
+    def _group_inds(
+        self,
+        qubits: Sequence[str],
+        inds: Sequence[int],
+        value: Callable[..., Hashable],
+        pairs: bool = False,
+    ) -> dict[Hashable, list[int]]:
+        """Returns the indices grouped by ``value(qubit)``, or by
+        ``value(qubit_1, qubit_2)`` for each pair of qubits if ``pairs = True``.
+
+        The noise channels of qubits with the same value can be applied
+        with a single instruction.
+        """
+        inds_by_value = {}
+        if not pairs:
+            for qubit, ind in zip(qubits, inds):
+                inds_by_value.setdefault(value(qubit), []).append(ind)
+            return inds_by_value
+
+        for i in range(0, len(inds), 2):
+            val = value(*qubits[i : i + 2])
+            inds_by_value.setdefault(val, []).extend(inds[i : i + 2])
+        return inds_by_value
+
+    def _inds_by_param(
+        self,
+        param: str,
+        qubits: Sequence[str],
+        inds: Sequence[int],
+        pairs: bool = False,
+    ) -> dict[Hashable, list[int]]:
+        """Returns the indices grouped by the value of ``param`` for each
+        qubit, or for each pair of qubits if ``pairs = True``."""
+        return self._group_inds(qubits, inds, partial(self.param, param), pairs)
+
+    def _meas_runs(
+        self, qubits: Sequence[str], inds: Sequence[int]
+    ) -> list[tuple[tuple[float, ...], list[int]]]:
+        """Returns the measurement arguments and indices of the runs of
+        consecutive qubits with the same assignment error.
+
+        The measurement order must be kept for ``meas_target``, thus only
+        consecutive qubits can share a measurement instruction.
+        """
+        meas_runs = []
+        for qubit, ind in zip(qubits, inds):
+            if self.param("assign_error_flag", qubit):
+                meas_args = (self.param("assign_error_prob", qubit),)
+            else:
+                meas_args = ()
+            if meas_runs and meas_runs[-1][0] == meas_args:
+                meas_runs[-1][1].append(ind)
+            else:
+                meas_runs.append((meas_args, [ind]))
+        return meas_runs
+
+    def _instr(
+        self, name: str, targets: Sequence, args: Sequence[float] = ()
+    ) -> CircuitInstruction:
+        """Returns the ``stim.CircuitInstruction`` for the given name, targets
+        and arguments.
+
+        ``stim.CircuitInstruction`` objects are immutable, thus the same object
+        is reused every time the same instruction is requested. In an experiment
+        there are only a few different instructions, so this avoids building
+        a new object for every operation.
+        """
+        key = (name, tuple(targets), tuple(args))
+        instr = self._instr_cache.get(key)
+        if instr is None:
+            instr = CircuitInstruction(name, targets, args)
+            self._instr_cache[key] = instr
+        return instr
+
+    def _gate_circuit(
+        self,
+        name: str,
+        inds: Sequence[int],
+        noise_name: str,
+        inds_by_prob: dict[float | tuple[float, ...], Sequence[int]],
+    ) -> Circuit:
+        """Returns a circuit with the gate or reset ``name`` acting on ``inds``
+        followed by the noise channel ``noise_name`` with the probabilities
+        and targets given in ``inds_by_prob``. The probabilities can be
+        a tuple for channels with several arguments (e.g. ``PAULI_CHANNEL_1``).
+
+        The circuit is built by ``stim`` from a single program text, which
+        is faster than appending the instructions one by one. The circuits
+        are cached, so a copy is returned to avoid modifying the cached one.
+        Noise channels with zero probability are not added to the circuit.
+        """
+        noise = tuple(
+            (prob, tuple(prob_inds)) for prob, prob_inds in inds_by_prob.items()
+        )
+        key = (name, tuple(inds), noise_name, noise)
+        circ = self._circ_cache.get(key)
+        if circ is None:
+            lines = [f"{name} " + " ".join(map(str, inds))]
+            for prob, prob_inds in inds_by_prob.items():
+                probs = prob if isinstance(prob, tuple) else (prob,)
+                if not any(probs):
+                    continue
+                args = ", ".join(repr(float(p)) for p in probs)
+                targets = " ".join(map(str, prob_inds))
+                lines.append(f"{noise_name}({args}) {targets}")
+            circ = Circuit("\n".join(lines))
+            self._circ_cache[key] = circ
+        return circ.copy()
+
+    def _meas_circuit(
+        self,
+        name: str,
+        meas_runs: Sequence[tuple[Sequence[float], Sequence[int]]],
+        noise_name: str | None = None,
+        inds_by_prob: dict[float, Sequence[int]] | None = None,
+    ) -> Circuit:
+        """Returns a circuit with the measurement ``name`` with the arguments
+        and targets given in ``meas_runs``. If ``noise_name`` is given, the
+        noise channel with the probabilities and targets given in
+        ``inds_by_prob`` is added before the measurements.
+
+        As in ``_gate_circuit``, the circuit is built by ``stim`` from a single
+        program text instead of appending the instructions one by one, and
+        it is cached, so a copy is returned to avoid modifying the cached one.
+        """
+        noise = ()
+        if noise_name is not None:
+            noise = tuple(
+                (prob, tuple(prob_inds)) for prob, prob_inds in inds_by_prob.items()
+            )
+        runs = tuple(
+            (tuple(meas_args), tuple(run_inds)) for meas_args, run_inds in meas_runs
+        )
+        key = (name, noise_name, noise, runs)
+        circ = self._circ_cache.get(key)
+        if circ is None:
+            lines = []
+            for prob, prob_inds in noise:
+                if not prob:
+                    continue
+                targets = " ".join(map(str, prob_inds))
+                lines.append(f"{noise_name}({float(prob)!r}) {targets}")
+            for meas_args, run_inds in runs:
+                targets = " ".join(map(str, run_inds))
+                if meas_args:
+                    args = ", ".join(repr(float(arg)) for arg in meas_args)
+                    lines.append(f"{name}({args}) {targets}")
+                else:
+                    lines.append(f"{name} {targets}")
+            circ = Circuit("\n".join(lines))
+            self._circ_cache[key] = circ
+        return circ.copy()
+
     # easier detector definition
     def add_meas(self, qubit: str) -> None:
         """Adds a measurement record for the specified qubit.
@@ -45,6 +217,21 @@ class Model(object):
         self._num_meas += 1
         return
 
+    def add_meas_many(self, qubits: Iterable[str]) -> None:
+        """Adds a measurement record for each of the specified qubits,
+        in the given order. It is equivalent to calling ``add_meas`` for
+        each qubit.
+        """
+        qubits = list(qubits)
+        missing = [q for q in qubits if q not in self._qubit_inds]
+        if missing:
+            raise ValueError(f"{missing} are not in the specified qubit_inds.")
+
+        for meas_ind, qubit in enumerate(qubits, start=self._num_meas):
+            self._meas_order[qubit].append(meas_ind)
+        self._num_meas += len(qubits)
+        return
+
     def meas_target(self, qubit: str, rel_meas_ind: int) -> GateTarget:
         """Returns the global measurement index for ``stim.target_rec`` for the
         specified qubit and its relative measurement index
@@ -93,10 +280,14 @@ class Model(object):
         return target_rec(abs_meas_ind - self._num_meas)
 
     def new_circuit(self) -> None:
-        """Empties the variables used for ``meas_target``. This must be called
-        when creating a new circuit."""
+        """Empties the variables used for ``meas_target`` and the caches of
+        indices, instructions and circuits. This must be called when creating
+        a new circuit."""
         self._meas_order = {q: [] for q in self._qubit_inds}
         self._num_meas = 0
+        self._inds_cache.clear()
+        self._instr_cache.clear()
+        self._circ_cache.clear()
         return
 
     # annotation operations
@@ -108,8 +299,57 @@ class Model(object):
         """
         return Circuit("TICK")
 
+    def repeat(self, num_repetitions: int, builder: Callable[[], Circuit]) -> Circuit:
+        """Returns a circuit with a ``REPEAT`` block of the circuit generated
+        by ``builder``.
+
+        The ``builder`` is only called once, so the repeated operations are
+        not generated nor stored ``num_repetitions`` times. The measurements
+        added by ``builder`` (see ``add_meas``) are recorded as if they had
+        been performed ``num_repetitions`` times so that ``meas_target``
+        can be used after the ``REPEAT`` block.
+
+        Parameters
+        ----------
+        num_repetitions
+            Number of times to repeat the circuit from ``builder``.
+        builder
+            Function without arguments that returns the circuit to repeat.
+            It must build the circuit using this model.
+
+        Returns
+        -------
+        Circuit
+            Circuit containing the ``REPEAT`` block.
+        """
+        if not isinstance(num_repetitions, int):
+            raise TypeError(
+                "'num_repetitions' must be an int, "
+                f"but {type(num_repetitions)} was given."
+            )
+        if num_repetitions < 1:
+            raise ValueError(
+                f"'num_repetitions' must be positive, but {num_repetitions} was given."
+            )
+
+        prev_num_meas = self._num_meas
+        prev_meas_order = {q: len(m) for q, m in self._meas_order.items()}
+        body = builder()
+        body_num_meas = self._num_meas - prev_num_meas
+
+        for qubit, num_meas in prev_meas_order.items():
+            body_meas = self._meas_order[qubit][num_meas:]
+            for k in range(1, num_repetitions):
+                self._meas_order[qubit] += [m + k * body_num_meas for m in body_meas]
+        self._num_meas += (num_repetitions - 1) * body_num_meas
+
+        circ = Circuit()
+        circ.append(CircuitRepeatBlock(num_repetitions, body))
+        return circ
+
     def qubit_coords(self, coords: dict[str, list]) -> Circuit:
-        if set(coords) > set(self._qubit_inds):
+        # 'dict.keys' supports set operations without building new sets
+        if not (coords.keys() <= self._qubit_inds.keys()):
             raise ValueError(
                 "'coords' have qubits not defined in the model:\n"
                 f"coords={list(coords.keys())}\nmodel={list(self._qubit_inds.keys())}."
@@ -119,7 +359,7 @@ class Model(object):
 
         for q_label, q_coords in coords.items():
             q_ind = self._qubit_inds[q_label]
-            circ.append(CircuitInstruction("QUBIT_COORDS", [q_ind], q_coords))
+            circ.append(CircuitInstruction("QUBIT_COORDS", (q_ind,), q_coords))
 
         return circ
 
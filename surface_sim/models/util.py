@@ -1,15 +1,15 @@
 from collections.abc import Iterable, Iterator
 
-from itertools import product
+from functools import lru_cache
 
 import numpy as np
 from math import exp
 
 
-def num_biased_ops(n):
-    inds = np.arange(n)
-    res = np.sum(np.power(4, inds) * np.power(3, n - 1 - inds))
-    return res
+def num_biased_ops(n: int) -> int:
+    # sum_{i=0}^{n-1} 4^i * 3^(n-1-i) = 4^n - 3^n,
+    # i.e. all n-qubit Paulis minus the ones without the biased Pauli
+    return 4**n - 3**n
 
 
 def grouper(iterable: Iterable[str], block_size: int) -> Iterator[tuple[str, ...]]:
@@ -19,6 +19,7 @@ def grouper(iterable: Iterable[str], block_size: int) -> Iterator[tuple[str, ...
     return zip(*args, strict=True)
 
 
+@lru_cache(maxsize=64)
 def biased_prefactors(
     biased_pauli: str, biased_factor: float, num_qubits: int
 ) -> np.ndarray:
@@ -43,30 +44,35 @@ def biased_prefactors(
     Returns
     -------
     prefactors
-        The array of prefactors
+        The array of prefactors. The results are cached, thus the array
+        is read-only to avoid modifying the cached values.
     """
     paulis = ["I", "X", "Y", "Z"]
-    # get all pauli combinations and remove identity operator
-    operators = list(product(paulis, repeat=num_qubits))[1:]
+    if biased_pauli not in paulis:
+        raise ValueError(
+            f"'biased_pauli' must be one of {paulis}, but {biased_pauli} was given."
+        )
+
+    # get all pauli combinations (encoded as base-4 digits, one per qubit)
+    # and remove identity operator. The order is the same as in
+    # 'itertools.product(paulis, repeat=num_qubits)'.
+    operators = np.arange(1, 4**num_qubits)
+    digits = (operators[:, None] // 4 ** np.arange(num_qubits)) % 4
     num_ops = len(operators)
 
-    biased_ops = [op for op in operators if biased_pauli in op]
-    num_biased = len(biased_ops)
+    is_biased = (digits == paulis.index(biased_pauli)).any(axis=1)
+    num_biased = np.count_nonzero(is_biased)
 
     nonbias_prefactor = 1 / (num_biased * (biased_factor - 1) + num_ops)
     bias_prefactor = biased_factor * nonbias_prefactor
 
-    prefactors = []
-    for op in operators:
-        if biased_pauli in op:
-            prefactors.append(bias_prefactor)
-        else:
-            prefactors.append(nonbias_prefactor)
-    prefactors_np = np.array(prefactors)
+    prefactors_np = np.where(is_biased, bias_prefactor, nonbias_prefactor)
+    prefactors_np.setflags(write=False)
 
     return prefactors_np
 
 
+@lru_cache(maxsize=1024)
 def idle_error_probs(
     relax_time: float, deph_time: float, duration: float
 ) -> tuple[float, float, float]:
@@ -35,6 +35,9 @@ class Setup:
         self._qubit_params = dict()
         self._global_params = dict()
         self._var_params = dict()
+        # cache of the values returned by 'param', it is cleared when
+        # any parameter is modified
+        self._param_cache = dict()
 
         _setup = deepcopy(setup)
         self.name = _setup.pop("name", None)
@@ -167,6 +170,7 @@ class Setup:
                 f"'var_param' must be a str, but {type(var_param)} was given."
             )
         self._var_params[var_param] = val
+        self._param_cache.clear()
         return
 
     def set_param(
@@ -198,6 +202,9 @@ class Setup:
                 raise TypeError("All qubits must be str.")
             self._qubit_params[qubits][param] = param_val
 
+        self._param_cache.clear()
+        return
+
     def param(self, param: str, *qubits: str) -> float:
         """Returns the value of the given parameter for the specified qubit(s).
 
@@ -213,6 +220,16 @@ class Setup:
         val
             Value of the parameter.
         """
+        try:
+            return self._param_cache[param, qubits]
+        except (KeyError, TypeError):
+            pass
+
+        val = self._param(param, *qubits)
+        self._param_cache[param, qubits] = val
+        return val
+
+    def _param(self, param: str, *qubits: str) -> float:
         if not isinstance(param, str):
             raise TypeError(f"'param' must be a str, but {type(param)} was given.")
         if any(not isinstance(q, str) for q in qubits):
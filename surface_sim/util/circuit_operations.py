@@ -12,20 +12,22 @@ from ..detectors import (
 from ..models import Model
 
 
-MEAS_INSTR = [
-    "M",
-    "MR",
-    "MRX",
-    "MRY",
-    "MRZ",
-    "MX",
-    "MY",
-    "MZ",
-    "MXX",
-    "MYY",
-    "MZZ",
-    "MPP",
-]
+MEAS_INSTR = frozenset(
+    {
+        "M",
+        "MR",
+        "MRX",
+        "MRY",
+        "MRZ",
+        "MX",
+        "MY",
+        "MZ",
+        "MXX",
+        "MYY",
+        "MZZ",
+        "MPP",
+    }
+)
 
 
 def merge_circuits(*circuits: stim.Circuit) -> stim.Circuit:
@@ -143,7 +145,7 @@ def merge_ops(
         raise TypeError(
             f"'log_obs_inds' must be a dict, but {type(log_obs_inds)} was given."
         )
-    layouts = sum([list(i[1:]) for i in ops], start=[])
+    layouts = list(chain.from_iterable(i[1:] for i in ops))
     if len(layouts) != len(set(layouts)):
         raise ValueError("Layouts are participating in more than one operation.")
 
@@ -220,9 +222,9 @@ def merge_ops(
                     name="OBSERVABLE_INCLUDE",
                     targets=targets,
                     gate_args=(
-                        [log_obs_inds[log_qubit_label]]
+                        (log_obs_inds[log_qubit_label],)
                         if not isinstance(log_obs_inds, int)
-                        else [log_obs_inds]
+                        else (log_obs_inds,)
                     ),
                 )
                 if isinstance(log_obs_inds, int):
@@ -274,11 +276,11 @@ def merge_tick_blocks(*blocks: stim.Circuit) -> stim.Circuit:
     for t in range(max_length):
         for mblocks in mergeable_blocks.values():
             for block in mblocks:
-                if t > len(block):
+                if t >= len(block):
                     continue
-                # the trick with the indices ensures that the returned object
-                # is a stim.Circuit instead of a stim.CircuitInstruction
-                merged_circuit += block[t : t + 1]
+                # appending the instruction avoids building a one-instruction
+                # stim.Circuit with 'block[t : t + 1]' for each of them
+                merged_circuit.append(block[t])
 
     return merged_circuit
 
@@ -347,7 +349,7 @@ def merge_qec_rounds(
         )
     if anc_detectors is not None:
         data_qubits = [l.get_qubits(role="data") for l in layouts]
-        if set(anc_detectors).intersection(sum(data_qubits, start=[])) != set():
+        if not set(anc_detectors).isdisjoint(chain.from_iterable(data_qubits)):
             raise ValueError("Some elements in 'anc_detectors' are not ancilla qubits.")
 
     tick = stim.Circuit("TICK")
@@ -454,7 +456,7 @@ def merge_log_meas(
 
     if anc_detectors is not None:
         anc_qubits = [l.get_qubits(role="anc") for l in layouts]
-        if set(anc_detectors) > set(sum(anc_qubits, start=[])):
+        if set(anc_detectors) > set(chain.from_iterable(anc_qubits)):
             raise ValueError("Some elements in 'anc_detectors' are not ancilla qubits.")
 
     tick = stim.Circuit("TICK")
@@ -498,7 +500,7 @@ def merge_log_meas(
             log_data_qubits = log_qubits_support[log_qubit_label]
             targets = [model.meas_target(qubit, -1) for qubit in log_data_qubits]
             instr = stim.CircuitInstruction(
-                "OBSERVABLE_INCLUDE", targets=targets, gate_args=[k * num_logs + l]
+                "OBSERVABLE_INCLUDE", targets=targets, gate_args=(k * num_logs + l,)
             )
             circuit.append(instr)
 
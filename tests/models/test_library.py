@@ -1,8 +1,12 @@
-from stim import Circuit, target_rec
+from copy import deepcopy
+
+from stim import Circuit, CircuitInstruction, target_rec
 
 from surface_sim import Setup
+from surface_sim.models.util import biased_prefactors, idle_error_probs
 from surface_sim.models import (
     NoiselessModel,
+    BiasedCircuitNoiseModel,
     DecoherenceNoiseModel,
     ExperimentalNoiseModel,
     CircuitNoiseModel,
@@ -41,6 +45,33 @@ SETUP = {
     ],
 }
 
+# D2 and D3 have specific parameters and the pair (D2, D3) has specific
+# two-qubit gate parameters, thus the noise channels cannot be merged
+# into a single instruction
+NON_UNIFORM_SETUP = deepcopy(SETUP)
+NON_UNIFORM_SETUP["setup"][0]["biased_factor"] = 3
+NON_UNIFORM_SETUP["setup"] += [
+    {
+        "qubit": "D2",
+        "x_error_prob": 0.2,
+        "meas_error_prob": 0.2,
+        "assign_error_flag": False,
+        "reset_error_prob": 0.2,
+        "T1": 2,
+        "T2": 3,
+        "biased_factor": 2,
+    },
+    {
+        "qubit": "D3",
+        "meas_error_prob": 0.3,
+        "assign_error_prob": 0.3,
+        "T1": 2,
+        "T2": 3,
+    },
+    {"qubits": ["D2", "D3"], "cnot_error_prob": 0.4},
+]
+QUBIT_INDS = {"D1": 0, "D2": 1, "D3": 2, "D4": 3}
+
 NOISE_GATES = [
     "DEPOLARIZE1",
     "DEPOLARIZE2",
@@ -369,6 +400,23 @@ def test_DecoherentNoiseModel():
     return
 
 
+def test_DecoherentNoiseModel_asymmetric_noise():
+    setup = Setup(SETUP)
+    model = DecoherenceNoiseModel(
+        setup, qubit_inds={"D1": 0, "D2": 1}, symmetric_noise=False
+    )
+
+    for meas_name, meas in zip(
+        ["M", "MX", "MY"], [model.measure, model.measure_x, model.measure_y]
+    ):
+        ops = [o.name for o in meas(["D1", "D2"])]
+        assert ops == [meas_name, "PAULI_CHANNEL_1"]
+
+    assert model.meas_target("D2", -1) == target_rec(-1)
+
+    return
+
+
 def test_ExperimentalNoiseModel():
     setup = Setup(SETUP)
     model = ExperimentalNoiseModel(setup, qubit_inds={"D1": 0, "D2": 1})
@@ -567,3 +615,215 @@ def test_model_meas_roder():
         assert model.meas_target("D1", -2) == target_rec(-2)
 
     return
+
+
+def test_zero_probability_noise():
+    setup = Setup(SETUP)
+    setup.set_param("sq_error_prob", 0)
+    setup.set_param("meas_error_prob", 0)
+    setup.set_param("idle_error_prob", 0)
+    setup.set_param("assign_error_flag", False)
+    model = CircuitNoiseModel(setup, qubit_inds={"D1": 0, "D2": 1})
+
+    ops = [o.name for o in model.x_gate(["D1"])]
+    assert ops == ["X"]
+
+    ops = [o.name for o in model.measure(["D1"])]
+    assert ops == ["M"]
+
+    ops = [o.name for o in model.idle_noise(["D1"])]
+    assert ops == []
+
+    ops = [o.name for o in model.cnot(["D1", "D2"])]
+    assert "DEPOLARIZE2" in ops
+
+    return
+
+
+def test_zero_probability_noise_biased():
+    setup = Setup(NON_UNIFORM_SETUP)
+    setup.set_param("biased_pauli", "Z")
+    setup.set_param("sq_error_prob", 0)
+    setup.set_param("tq_error_prob", 0)
+    setup.set_param("idle_error_prob", 0)
+    model = BiasedCircuitNoiseModel(setup, qubit_inds=QUBIT_INDS)
+
+    ops = [o.name for o in model.hadamard(["D1", "D2"])]
+    assert ops == ["H"]
+
+    ops = [o.name for o in model.cphase(["D1", "D4"])]
+    assert ops == ["CZ"]
+
+    ops = [o.name for o in model.idle_noise(["D1", "D2"])]
+    assert ops == []
+
+    # only the noise of the non-zero-probability qubits is added
+    circ = model.x_gate(["D1", "D2", "D3"])
+    expected_circ = Circuit()
+    expected_circ.append(CircuitInstruction("X", [0, 1, 2]))
+    probs = 0.2 * biased_prefactors("Z", 2, num_qubits=1)
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_1", [1], probs))
+    assert circ == expected_circ
+
+    circ = model.cnot(["D1", "D4", "D2", "D3"])
+    expected_circ = Circuit()
+    expected_circ.append(CircuitInstruction("CX", [0, 3, 1, 2]))
+    probs = 0.4 * biased_prefactors("Z", 3, num_qubits=2)
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_2", [1, 2], probs))
+    assert circ == expected_circ
+
+    return
+
+
+def test_zero_probability_noise_incoming():
+    setup = Setup(SETUP)
+    setup.set_param("idle_error_prob", 0)
+    model = IncomingNoiseModel(setup, qubit_inds={"D1": 0, "D2": 1})
+
+    ops = [o.name for o in model.incoming_noise(["D1", "D2"])]
+    assert ops == []
+
+    setup = Setup(NON_UNIFORM_SETUP)
+    setup.set_param("idle_error_prob", 0)
+    setup.set_param("idle_error_prob", 0.2, "D2")
+    model = IncomingNoiseModel(setup, qubit_inds=QUBIT_INDS)
+
+    circ = model.incoming_noise(["D1", "D2", "D3"])
+    assert circ == Circuit("X_ERROR(0.2) 1\nZ_ERROR(0.2) 1")
+
+    return
+
+
+def test_non_uniform_CircuitNoiseModel():
+    setup = Setup(NON_UNIFORM_SETUP)
+    model = CircuitNoiseModel(setup, qubit_inds=QUBIT_INDS)
+
+    circ = model.x_gate(["D1", "D2", "D3"])
+    assert circ == Circuit("X 0 1 2\nDEPOLARIZE1(0.1) 0 2\nDEPOLARIZE1(0.2) 1")
+
+    circ = model.cnot(["D1", "D4", "D2", "D3"])
+    assert circ == Circuit("CX 0 3 1 2\nDEPOLARIZE2(0.1) 0 3\nDEPOLARIZE2(0.4) 1 2")
+
+    circ = model.reset(["D1", "D2", "D4"])
+    assert circ == Circuit("R 0 1 3\nX_ERROR(0.1) 0 3\nX_ERROR(0.2) 1")
+
+    circ = model.measure(["D1", "D2", "D4", "D3"])
+    expected_circ = Circuit("""
+        X_ERROR(0.1) 0 3
+        X_ERROR(0.2) 1
+        X_ERROR(0.3) 2
+        M(0.1) 0
+        M 1
+        M(0.1) 3
+        M(0.3) 2
+        """)
+    assert circ == expected_circ
+    assert model.meas_target("D1", -1) == target_rec(-4)
+    assert model.meas_target("D2", -1) == target_rec(-3)
+    assert model.meas_target("D4", -1) == target_rec(-2)
+    assert model.meas_target("D3", -1) == target_rec(-1)
+
+    return
+
+
+def test_non_uniform_BiasedCircuitNoiseModel():
+    setup = Setup(NON_UNIFORM_SETUP)
+    setup.set_param("biased_pauli", "Z")
+    model = BiasedCircuitNoiseModel(setup, qubit_inds=QUBIT_INDS)
+
+    circ = model.x_gate(["D1", "D2", "D3"])
+    expected_circ = Circuit()
+    expected_circ.append(CircuitInstruction("X", [0, 1, 2]))
+    probs_1 = 0.1 * biased_prefactors("Z", 3, num_qubits=1)
+    probs_2 = 0.2 * biased_prefactors("Z", 2, num_qubits=1)
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_1", [0, 2], probs_1))
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_1", [1], probs_2))
+    assert circ == expected_circ
+
+    circ = model.cnot(["D1", "D4", "D2", "D3"])
+    expected_circ = Circuit()
+    expected_circ.append(CircuitInstruction("CX", [0, 3, 1, 2]))
+    probs_1 = 0.1 * biased_prefactors("Z", 3, num_qubits=2)
+    probs_2 = 0.4 * biased_prefactors("Z", 3, num_qubits=2)
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_2", [0, 3], probs_1))
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_2", [1, 2], probs_2))
+    assert circ == expected_circ
+
+    circ = model.measure_x(["D1", "D2", "D3"])
+    expected_circ = Circuit("""
+        Z_ERROR(0.1) 0
+        Z_ERROR(0.2) 1
+        Z_ERROR(0.3) 2
+        MX(0.1) 0
+        MX 1
+        MX(0.3) 2
+        """)
+    assert circ == expected_circ
+    assert model.meas_target("D2", -1) == target_rec(-2)
+
+    return
+
+
+def test_non_uniform_DecoherenceNoiseModel():
+    setup = Setup(NON_UNIFORM_SETUP)
+    model = DecoherenceNoiseModel(setup, qubit_inds=QUBIT_INDS)
+
+    circ = model.idle_noise(["D1", "D2", "D4", "D3"], duration=1)
+    expected_circ = Circuit()
+    probs_1 = idle_error_probs(relax_time=1, deph_time=1, duration=1)
+    probs_2 = idle_error_probs(relax_time=2, deph_time=3, duration=1)
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_1", [0, 3], probs_1))
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_1", [1, 2], probs_2))
+    assert circ == expected_circ
+
+    circ = model.measure(["D1", "D2", "D3"])
+    assert [i for i in circ if i.name == "M"] == [
+        CircuitInstruction("M", [0], [0.1]),
+        CircuitInstruction("M", [1]),
+        CircuitInstruction("M", [2], [0.3]),
+    ]
+    assert model.meas_target("D1", -1) == target_rec(-3)
+
+    return
+
+
+def test_non_uniform_ExperimentalNoiseModel():
+    setup = Setup(NON_UNIFORM_SETUP)
+    model = ExperimentalNoiseModel(setup, qubit_inds=QUBIT_INDS)
+
+    circ = model.x_gate(["D1", "D2", "D3"])
+    assert circ == Circuit("X 0 1 2\nDEPOLARIZE1(0.1) 0 2\nDEPOLARIZE1(0.2) 1")
+
+    circ = model.cnot(["D1", "D4", "D2", "D3"])
+    assert circ == Circuit("CX 0 3 1 2\nDEPOLARIZE2(0.1) 0 3\nDEPOLARIZE2(0.4) 1 2")
+
+    circ = model.idle_noise(["D1", "D2", "D4", "D3"], duration=1)
+    expected_circ = Circuit()
+    probs_1 = idle_error_probs(relax_time=1, deph_time=1, duration=1)
+    probs_2 = idle_error_probs(relax_time=2, deph_time=3, duration=1)
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_1", [0, 3], probs_1))
+    expected_circ.append(CircuitInstruction("PAULI_CHANNEL_1", [1, 2], probs_2))
+    assert circ == expected_circ
+
+    return
+
+
+def test_non_uniform_measurement_noise():
+    for model_class in [MeasurementNoiseModel, PhenomenologicalNoiseModel]:
+        setup = Setup(NON_UNIFORM_SETUP)
+        model = model_class(setup, qubit_inds=QUBIT_INDS)
+
+        circ = model.measure_y(["D1", "D2", "D4", "D3"])
+        expected_circ = Circuit("""
+            X_ERROR(0.1) 0 3
+            X_ERROR(0.2) 1
+            X_ERROR(0.3) 2
+            MY(0.1) 0
+            MY 1
+            MY(0.1) 3
+            MY(0.3) 2
+            """)
+        assert circ == expected_circ
+        assert model.meas_target("D2", -1) == target_rec(-3)
+
+    return
@@ -1,4 +1,9 @@
+import pytest
+
+from stim import CircuitRepeatBlock, target_rec
+
 from surface_sim import Model, Setup
+from surface_sim.models import CircuitNoiseModel, NoiselessModel
 
 SETUP = {
     "gate_durations": {
@@ -35,6 +40,35 @@ def test_qubit_inds():
     for qubit, ind in qubit_inds.items():
         assert ind == model.get_inds([qubit])[0]
 
+    inds = model.get_inds(["D1", "d3"])
+    assert inds == [300, 2]
+    inds.append(1)
+    assert model.get_inds(["D1", "d3"]) == [300, 2]
+
+    return
+
+
+def test_new_circuit_after_changing_qubit_inds():
+    def build_circuit(model):
+        circ = model.x_gate(["D1", "D2"])
+        circ += model.idle_noise(["D1", "D2"])
+        circ += model.measure(["D1", "D2"])
+        return circ
+
+    setup = Setup(SETUP)
+    qubit_inds = {"D1": 0, "D2": 1}
+    model = CircuitNoiseModel(setup, qubit_inds=qubit_inds)
+    build_circuit(model)
+
+    qubit_inds["D1"] = 2
+    model.new_circuit()
+    circ = build_circuit(model)
+
+    other_model = CircuitNoiseModel(setup, qubit_inds={"D1": 2, "D2": 1})
+    assert circ == build_circuit(other_model)
+    assert model.meas_target("D1", -1) == other_model.meas_target("D1", -1)
+    assert model.meas_target("D2", -1) == other_model.meas_target("D2", -1)
+
     return
 
 
@@ -48,3 +82,55 @@ def test_setup_from_model():
     assert SETUP["setup"][0]["T1"] == model.param("T1")
 
     return
+
+
+def test_repeat():
+    qubit_inds = {"D1": 0, "D2": 1}
+    model = NoiselessModel(qubit_inds=qubit_inds)
+
+    circuit = model.measure(["D1"])
+    circuit += model.repeat(3, lambda: model.measure(["D1", "D2"]))
+
+    assert circuit.num_measurements == 7
+    assert len(circuit) == 2
+    assert isinstance(circuit[1], CircuitRepeatBlock)
+    assert model.meas_target("D1", -1) == target_rec(-2)
+    assert model.meas_target("D2", -1) == target_rec(-1)
+    assert model.meas_target("D1", -3) == target_rec(-6)
+    assert model.meas_target("D1", -4) == target_rec(-7)
+
+    return
+
+
+def test_add_meas_many():
+    qubit_inds = {"D1": 0, "D2": 1, "D3": 2}
+    model = Model(setup=Setup(SETUP), qubit_inds=qubit_inds)
+    other_model = Model(setup=Setup(SETUP), qubit_inds=qubit_inds)
+
+    model.add_meas("D2")
+    model.add_meas_many(["D1", "D2", "D3"])
+    for qubit in ["D2", "D1", "D2", "D3"]:
+        other_model.add_meas(qubit)
+
+    for qubit, rel_meas_ind in [("D1", -1), ("D2", -1), ("D2", -2), ("D3", -1)]:
+        assert model.meas_target(qubit, rel_meas_ind) == other_model.meas_target(
+            qubit, rel_meas_ind
+        )
+
+    with pytest.raises(ValueError):
+        model.add_meas_many(["D1", "D4"])
+
+    return
+
+
+def test_qubit_coords():
+    qubit_inds = {"D1": 0, "D2": 1}
+    model = Model(setup=Setup(SETUP), qubit_inds=qubit_inds)
+
+    circuit = model.qubit_coords({"D2": [1, 2]})
+    assert str(circuit) == "QUBIT_COORDS(1, 2) 1"
+
+    with pytest.raises(ValueError):
+        model.qubit_coords({"D1": [0, 0], "D3": [1, 1]})
+
+    return
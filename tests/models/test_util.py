@@ -0,0 +1,37 @@
+from itertools import product
+
+import numpy as np
+import pytest
+
+from surface_sim.models.util import biased_prefactors, num_biased_ops
+
+
+def test_biased_prefactors():
+    for num_qubits in [1, 2, 3]:
+        for biased_pauli in ["X", "Y", "Z"]:
+            prefactors = biased_prefactors(biased_pauli, 3.5, num_qubits)
+
+            operators = list(product("IXYZ", repeat=num_qubits))[1:]
+            is_biased = np.array([biased_pauli in op for op in operators])
+            assert prefactors.shape == (4**num_qubits - 1,)
+            assert np.allclose(prefactors[is_biased], 3.5 * prefactors[~is_biased][0])
+            assert np.allclose(prefactors[~is_biased], prefactors[~is_biased][0])
+            assert np.isclose(prefactors.sum(), 1)
+            assert not prefactors.flags.writeable
+
+    prefactors = biased_prefactors("Z", 1, 2)
+    assert np.allclose(prefactors, 1 / 15)
+
+    with pytest.raises(ValueError):
+        biased_prefactors("W", 1, 1)
+
+    return
+
+
+def test_num_biased_ops():
+    for n in range(1, 6):
+        operators = list(product("IXYZ", repeat=n))
+        num_biased = len([op for op in operators if "Z" in op])
+        assert num_biased_ops(n) == num_biased
+
+    return
@@ -5,3 +5,16 @@ def test_CircuitNoiseSetup():
     setup = CircuitNoiseSetup()
     setup.set_var_param("prob", 0.01)
     return
+
+
+def test_CircuitNoiseSetup_independent_instances():
+    setup = CircuitNoiseSetup()
+    setup.set_var_param("prob", 0.01)
+    setup.set_param("sq_error_prob", 0.1)
+
+    other_setup = CircuitNoiseSetup()
+    assert other_setup.free_params == ["prob"]
+    other_setup.set_var_param("prob", 0.02)
+    assert other_setup.param("sq_error_prob") == 0.02
+    assert setup.param("sq_error_prob") == 0.1
+    return
@@ -66,3 +66,17 @@ def test_parents():
     assert "swap_error_prob" not in SETUP["setup"]
     assert setup.param("swap_error_prob", "D1") == 0.33
     return
+
+
+def test_param_after_setting_params():
+    setup = Setup(SETUP)
+    setup.set_var_param("free", 0.12)
+    assert setup.param("sq_error_prob", "D1") == 0.12
+
+    setup.set_var_param("free", 0.2)
+    assert setup.param("sq_error_prob", "D1") == 0.2
+
+    setup.set_param("sq_error_prob", 0.3)
+    assert setup.param("sq_error_prob", "D1") == 0.3
+    assert setup.param("x_error_prob", "D1") == 0.3
+    return